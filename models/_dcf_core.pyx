@@ -0,0 +1,45 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled DCF valuation kernels, mirroring gdcf._dcf_core.
+
+Build in place with ``cythonize -i models/_dcf_core.pyx``. When the extension
+is not built, gdcf falls back to Numba or to the plain Python kernel.
+"""
+cimport cython
+
+
+@cython.cdivision(True)
+cpdef tuple dcf_core(double current_fcf, const double[::1] growth_rates, double wacc, double g_term,
+                     double spread, double cash, double debt, double shares, double[::1] projected):
+    """
+    Same contract as gdcf._dcf_core: fills ``projected`` and returns
+    (present value of FCFs, terminal value, present value of terminal value,
+    enterprise value, equity value, intrinsic value per share).
+    ``projected`` may be None when the projected FCFs are not needed.
+    """
+    cdef Py_ssize_t i, n = growth_rates.shape[0]
+    cdef bint store = projected is not None
+    cdef double last_fcf = current_fcf, pv_fcfs = 0.0
+    cdef double df = 1.0 / (1.0 + wacc), cur_df = 1.0
+    cdef double terminal_value, pv_terminal_value, enterprise_value, equity_value
+
+    for i in range(n):
+        last_fcf = last_fcf * (1.0 + growth_rates[i])
+        cur_df = cur_df * df
+        if store:
+            projected[i] = last_fcf
+        pv_fcfs += last_fcf * cur_df
+
+    terminal_value = last_fcf * (1.0 + g_term) / spread
+    pv_terminal_value = terminal_value * cur_df
+    enterprise_value = pv_fcfs + pv_terminal_value
+    equity_value = enterprise_value + cash - debt
+    return pv_fcfs, terminal_value, pv_terminal_value, enterprise_value, equity_value, equity_value / shares
+
+
+cpdef double dcf_intrinsic(double fcf0, const double[::1] growth, double wacc, double g_term,
+                           double cash, double debt, double shares):
+    """
+    Intrinsic value per share only, for callers running valuations in a tight loop.
+    """
+    return dcf_core(fcf0, growth, wacc, g_term, wacc - g_term, cash, debt, shares, None)[5]
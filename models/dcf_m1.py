@@ -1,10 +1,15 @@
-import argparse, traceback
-from decimal import Decimal
+import argparse, sys, traceback
+
+import numpy as np
 
 from modeling.data import *
 
 
 class DCF:
+	__slots__ = ('_ticker', '_ev_statement', '_income_statement', '_balance_statement', '_cashflow_statement',
+				 '_discount_rate', '_forecast_period', '_earnings_growth_rate', '_cap_ex_growth_rate',
+				 '_perpetual_growth_rate', '_verbose', '_enterprise_value', '_equity_value', '_share_price', '_date')
+
 	def __init__(self):
 		self._ticker = None
 		self._ev_statement = None
@@ -16,6 +21,7 @@ class DCF:
 		self._earnings_growth_rate = None
 		self._cap_ex_growth_rate = None
 		self._perpetual_growth_rate = None
+		self._verbose = False
 		self._enterprise_value = None
 		self._equity_value = None
 		self._share_price = None
@@ -32,12 +38,13 @@ class DCF:
 		self._cashflow_statement = cashflow_statement
 		return self
 
-	def set_forecast_parameters(self, discount_rate, forecast_period, earnings_growth_rate, cap_ex_growth_rate, perpetual_growth_rate):
+	def set_forecast_parameters(self, discount_rate, forecast_period, earnings_growth_rate, cap_ex_growth_rate, perpetual_growth_rate, verbose=False):
 		self._discount_rate = discount_rate
 		self._forecast_period = forecast_period
 		self._earnings_growth_rate = earnings_growth_rate
 		self._cap_ex_growth_rate = cap_ex_growth_rate
 		self._perpetual_growth_rate = perpetual_growth_rate
+		self._verbose = verbose
 		return self
 
 
@@ -61,9 +68,9 @@ class DCF:
 		self._calculate_enterprise_value()
 		self._calculate_equity_value_and_share_price()
 
-		print('\nEnterprise Value for {}: ${}.'.format(self._ticker, '%.2E' % Decimal(str(self._enterprise_value))),
-			'\nEquity Value for {}: ${}.'.format(self._ticker, '%.2E' % Decimal(str(self._equity_value))),
-			'\nPer share value for {}: ${}.\n'.format(self._ticker, '%.2E' % Decimal(str(self._share_price))),
+		print('\nEnterprise Value for {}: ${}.'.format(self._ticker, f"{self._enterprise_value:.2E}"),
+			'\nEquity Value for {}: ${}.'.format(self._ticker, f"{self._equity_value:.2E}"),
+			'\nPer share value for {}: ${}.\n'.format(self._ticker, f"{self._share_price:.2E}"),
 			)
 
 		return {
@@ -89,45 +96,49 @@ class DCF:
 	def _enterprise_value_calculation(self, income_statement, cashflow_statement, balance_statement, period, discount_rate, earnings_growth_rate, cap_ex_growth_rate, perpetual_growth_rate):
 		#Implementation remains the same as in the original code
 		# ... (rest of the enterprise_value function remains unchanged) ...
-		if income_statement[0]['EBIT']:
-			ebit = float(income_statement[0]['EBIT'])
+		income = income_statement[0]
+		cashflow = cashflow_statement[0]
+		balance, prev_balance = balance_statement[0], balance_statement[1]
+		date = income['date']
+		base_year = int(date[:4])
+		egr = earnings_growth_rate
+		cegr = cap_ex_growth_rate
+
+		if income['EBIT']:
+			ebit = float(income['EBIT'])
 		else:
-			ebit = float(input(f"EBIT missing. Enter EBIT on {income_statement[0]['date']} or skip: "))
-		tax_rate = float(income_statement[0]['Income Tax Expense']) / \
-				float(income_statement[0]['Earnings before Tax'])
-		non_cash_charges = float(cashflow_statement[0]['Depreciation & Amortization'])
-		cwc = (float(balance_statement[0]['Total assets']) - float(balance_statement[0]['Total non-current assets'])) - \
-			(float(balance_statement[1]['Total assets']) - float(balance_statement[1]['Total non-current assets']))
-		cap_ex = float(cashflow_statement[0]['Capital Expenditure'])
+			ebit = float(input(f"EBIT missing. Enter EBIT on {date} or skip: "))
+		tax_rate = float(income['Income Tax Expense']) / float(income['Earnings before Tax'])
+		non_cash_charges = float(cashflow['Depreciation & Amortization'])
+		cwc = (float(balance['Total assets']) - float(balance['Total non-current assets'])) - \
+			(float(prev_balance['Total assets']) - float(prev_balance['Total non-current assets']))
+		cap_ex = float(cashflow['Capital Expenditure'])
 		discount = discount_rate
 
-		flows = []
-
-		print('Forecasting flows for {} years out, starting at {}.'.format(period, income_statement[0]['date']),
-			('\n         DFCF   |    EBIT   |    D&A    |    CWC     |   CAP_EX   | '))
-		for yr in range(1, period + 1):
-
-			ebit = ebit * (1 + (yr * earnings_growth_rate))
-			non_cash_charges = non_cash_charges * (1 + (yr * earnings_growth_rate))
-			cwc = cwc * 0.7  # TODO: evaluate this cwc rate? 0.1 annually?
-			cap_ex = cap_ex * (1 + (yr * cap_ex_growth_rate))
-
-			flow = self._ulFCF(ebit, tax_rate, non_cash_charges, cwc, cap_ex)
-			PV_flow = flow / ((1 + discount) ** yr)
-			flows.append(PV_flow)
-
-			print(str(int(income_statement[0]['date'][0:4]) + yr) + '  ',
-				'%.2E' % Decimal(PV_flow) + ' | ',
-				'%.2E' % Decimal(ebit) + ' | ',
-				'%.2E' % Decimal(non_cash_charges) + ' | ',
-				'%.2E' % Decimal(cwc) + ' | ',
-				'%.2E' % Decimal(cap_ex) + ' | ')
-
-		NPV_FCF = sum(flows)
-
-		final_cashflow = flows[-1] * (1 + perpetual_growth_rate)
+		# Each year compounds on the previous one, so the whole schedule is a cumulative product
+		yrs = np.arange(1, period + 1, dtype=np.float64)
+		ebit_arr = ebit * np.cumprod(1 + yrs * egr)
+		non_cash_arr = non_cash_charges * np.cumprod(1 + yrs * egr)
+		cwc_arr = cwc * 0.7 ** yrs  # TODO: evaluate this cwc rate? 0.1 annually?
+		cap_ex_arr = cap_ex * np.cumprod(1 + yrs * cegr)
+
+		flows = self._ulFCF(ebit_arr, tax_rate, non_cash_arr, cwc_arr, cap_ex_arr)
+		# Running product of 1 / (1 + discount) rather than a pow per year
+		d = 1.0 / (1.0 + discount)
+		discount_factors = np.cumprod(np.full(period, d))
+		PV_flows = flows * discount_factors
+		NPV_FCF = float(np.dot(flows, discount_factors))
+
+		if self._verbose:
+			# Build the whole table first and write it in one call
+			rows = zip(range(base_year + 1, base_year + period + 1), PV_flows, ebit_arr, non_cash_arr, cwc_arr, cap_ex_arr)
+			sys.stdout.write('Forecasting flows for {} years out, starting at {}. \n'.format(period, date) +
+				'         DFCF   |    EBIT   |    D&A    |    CWC     |   CAP_EX   | \n' +
+				''.join(f'{y}   {pv:.2E} |  {e:.2E} |  {da:.2E} |  {c:.2E} |  {x:.2E} | \n' for y, pv, e, da, c, x in rows))
+
+		final_cashflow = float(PV_flows[-1]) * (1 + perpetual_growth_rate)
 		TV = final_cashflow / (discount - perpetual_growth_rate)
-		NPV_TV = TV / (1 + discount) ** (1 + period)
+		NPV_TV = TV * (float(discount_factors[-1]) * d)  # (1 + discount) ** -(1 + period)
 
 		return NPV_TV + NPV_FCF
 
@@ -139,8 +150,7 @@ if __name__ == "__main__":
 	#Fetch Data (replace with your actual data fetching)
 	ticker = 'AAPL'
 	apikey = '<YOUR_API_KEY>'  # Replace with your API Key
-	ev_statement = get_EV_statement(ticker, apikey=apikey)
-	ev_statement = get_EV_statement(ticker, apikey=apikey)[0]['enterpriseValue']  #Get most recent data
+	ev_statement = get_EV_statement(ticker, apikey=apikey)[0]['enterpriseValue']  #Get most recent data (one API call)
 	income_statement = get_income_statement(ticker, apikey=apikey)['financials']
 	balance_statement = get_balance_statement(ticker, apikey=apikey)['financials']
 	cashflow_statement = get_cashflow_statement(ticker, apikey=apikey)['financials']
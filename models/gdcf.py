@@ -1,16 +1,192 @@
-import numpy as np
+import platform
+
+# NumPy and Numba are imported on first use rather than at module load, so that
+# importing this module (e.g. from an Odoo worker at server start) stays cheap.
+
+# Under PyPy growth rates are kept as plain lists so the setters need no NumPy; there
+# calc() runs the pure Python kernel, whose loop the tracing JIT compiles about as
+# well as Numba would.
+_PYPY = platform.python_implementation() == "PyPy"
+
+
+def _dcf_core(current_fcf, growth_rates, wacc, g_term, spread, cash, debt, shares, projected):
+    """
+    Numeric core of DCF.calc, in a single pass over the growth rates.
+
+    Writes the projected FCFs into ``projected`` and returns a tuple of
+    (present value of FCFs, terminal value, present value of terminal value,
+    enterprise value, equity value, intrinsic value per share).
+    ``spread`` is WACC - g, precomputed by the caller.
+    """
+    n = len(growth_rates)
+
+    # 1. + 2. Project each year's FCF and discount it to present value; the discount
+    # factor is a running product, so after the loop it is (1 + WACC) ** -n
+    last_fcf = current_fcf
+    pv_fcfs = 0.0
+    df = 1.0 / (1.0 + wacc)
+    cur_df = 1.0
+    for i in range(n):
+        last_fcf = last_fcf * (1.0 + growth_rates[i])
+        cur_df = cur_df * df
+        projected[i] = last_fcf
+        pv_fcfs += last_fcf * cur_df
+
+    # 3. Terminal Value (Gordon Growth Model): TV = FCF_n * (1 + g) / (WACC - g)
+    terminal_value = last_fcf * (1.0 + g_term) / spread
+
+    # 4. Discount Terminal Value over the explicit forecast period
+    pv_terminal_value = terminal_value * cur_df
+
+    # 5. - 7. Enterprise Value, Equity Value and Intrinsic Value Per Share
+    enterprise_value = pv_fcfs + pv_terminal_value
+    equity_value = enterprise_value + cash - debt
+    return pv_fcfs, terminal_value, pv_terminal_value, enterprise_value, equity_value, equity_value / shares
+
+
+_DCF_CORE_SIGNATURE = \
+    "UniTuple(float64, 6)(float64, float64[::1], float64, float64, float64, float64, float64, float64, float64[::1])"
+_dcf_kernel = None
+_dcf_core_jit = None
+
+
+def _jit_dcf_core():
+    """
+    Returns _dcf_core compiled with Numba (once), or None when Numba is not installed.
+    """
+    global _dcf_core_jit
+    if _dcf_core_jit is None:
+        try:
+            from numba import njit
+        except ImportError:
+            return None
+        _dcf_core_jit = njit(_DCF_CORE_SIGNATURE, cache=True, fastmath=True)(_dcf_core)
+    return _dcf_core_jit
+
+
+def _get_dcf_kernel():
+    """
+    Returns the valuation kernel, resolved the first time it is requested: the
+    Cython build of _dcf_core.pyx if present (no JIT warm-up), else _dcf_core
+    compiled with Numba, else the plain Python function as is.
+    """
+    global _dcf_kernel
+    if _dcf_kernel is None:
+        try:
+            from ._dcf_core import dcf_core
+        except ImportError:
+            try:
+                # gdcf imported as a top-level module, e.g. run as a script
+                from _dcf_core import dcf_core
+            except ImportError:
+                dcf_core = None
+        _dcf_kernel = dcf_core or _jit_dcf_core() or _dcf_core
+    return _dcf_kernel
+
+
+def _make_dcf_gu(kernel):
+    """
+    Builds the generalized ufunc body with layout (n),(),(),(),(),(),()->(), which
+    runs ``kernel`` (a _dcf_core implementation) on one scenario and writes its
+    intrinsic value per share into ``out[0]``.
+    """
+    import numpy as np
+
+    def _dcf_gu(growth_rates, wacc, g_term, current_fcf, cash, debt, shares, out):
+        growth = np.ascontiguousarray(growth_rates)
+        projected = np.empty_like(growth)
+        out[0] = kernel(current_fcf, growth, wacc, g_term, wacc - g_term, cash, debt, shares, projected)[5]
+
+    return _dcf_gu
+
+
+_DCF_GU_SIGNATURE = "void(float64[:], float64, float64, float64, float64, float64, float64, float64[:])"
+_DCF_GU_LAYOUT = "(n),(),(),(),(),(),()->()"
+_dcf_ufunc = None
+
+
+def _get_dcf_ufunc():
+    """
+    Returns the gufunc body as a parallel Numba gufunc, built the first time it is
+    requested. Without Numba, np.vectorize gives the same broadcasting semantics
+    over the plain Python kernel.
+    """
+    global _dcf_ufunc
+    if _dcf_ufunc is None:
+        kernel = _jit_dcf_core()
+        if kernel is None:
+            import numpy as np
+
+            dcf_gu = _make_dcf_gu(_dcf_core)
+
+            def intrinsic_value(*args):
+                out = [0.0]
+                dcf_gu(*args, out)
+                return out[0]
+
+            _dcf_ufunc = np.vectorize(intrinsic_value, otypes=[np.float64], signature=_DCF_GU_LAYOUT)
+        else:
+            from numba import guvectorize
+
+            _dcf_ufunc = guvectorize([_DCF_GU_SIGNATURE], _DCF_GU_LAYOUT,
+                                     nopython=True, cache=True, target='parallel')(_make_dcf_gu(kernel))
+    return _dcf_ufunc
+
 
 class DCF:
+    __slots__ = ('_current_fcf', '_growth_rates', '_terminal_growth_rate', '_wacc', '_spread',
+                 '_cash_and_equivalents', '_total_debt', '_shares_outstanding')
+
     def __init__(self):
         # Default parameters
         self._current_fcf = 0.0  # Current Free Cash Flow
         self._growth_rates = []  # List of growth rates for each projection period
         self._terminal_growth_rate = 0.02 # Perpetual growth rate after projection period
         self._wacc = 0.10 # Weighted Average Cost of Capital (discount rate)
+        self._spread = self._wacc - self._terminal_growth_rate # Terminal value denominator
         self._cash_and_equivalents = 0.0 # Cash and equivalents
         self._total_debt = 0.0 # Total debt
         self._shares_outstanding = 1.0 # Number of shares outstanding
 
+    @classmethod
+    def from_params(cls, current_fcf, growth_rates, wacc=0.10, terminal_growth_rate=0.02,
+                    cash_and_equivalents=0.0, total_debt=0.0, shares_outstanding=1.0):
+        """
+        Builds a DCF in one call, validating all parameters together instead of
+        through the chain of setters. Meant for bulk construction in sweeps.
+        """
+        current_fcf = float(current_fcf)
+        if _PYPY:
+            growth_rates = [float(r) for r in growth_rates]
+        else:
+            import numpy as np
+
+            # Check the shape before ascontiguousarray, which would promote a scalar to 1-D
+            growth_rates = np.asarray(growth_rates, dtype=np.float64)
+            if growth_rates.ndim != 1:
+                raise ValueError("Growth rates must be a list of numbers.")
+            growth_rates = np.ascontiguousarray(growth_rates)
+        wacc = float(wacc)
+        terminal_growth_rate = float(terminal_growth_rate)
+        cash_and_equivalents = float(cash_and_equivalents)
+        total_debt = float(total_debt)
+        shares_outstanding = float(shares_outstanding)
+        if not (current_fcf >= 0 and terminal_growth_rate < wacc and 0 < wacc < 1
+                and cash_and_equivalents >= 0 and total_debt >= 0 and shares_outstanding > 0):
+            raise ValueError("Invalid DCF parameters: FCF, cash and debt must be non-negative, shares positive, "
+                             "and WACC between 0 and 1 (exclusive) and greater than the terminal growth rate.")
+
+        dcf = cls.__new__(cls)
+        dcf._current_fcf = current_fcf
+        dcf._growth_rates = growth_rates
+        dcf._terminal_growth_rate = terminal_growth_rate
+        dcf._wacc = wacc
+        dcf._spread = wacc - terminal_growth_rate
+        dcf._cash_and_equivalents = cash_and_equivalents
+        dcf._total_debt = total_debt
+        dcf._shares_outstanding = shares_outstanding
+        return dcf
+
     # --- Setter Methods ---
     def set_current_fcf(self, fcf: float):
         if not isinstance(fcf, (int, float)) or fcf < 0:
@@ -21,19 +197,27 @@ class DCF:
     def set_growth_rates(self, rates: list):
         if not isinstance(rates, list) or not all(isinstance(r, (int, float)) for r in rates):
             raise ValueError("Growth rates must be a list of numbers.")
-        self._growth_rates = rates
+        if _PYPY:
+            self._growth_rates = [float(r) for r in rates]
+        else:
+            import numpy as np
+
+            # Stored as a contiguous float64 buffer so calc() can hand it straight to the kernel
+            self._growth_rates = np.ascontiguousarray(rates, dtype=np.float64)
         return self
 
     def set_terminal_growth_rate(self, rate: float):
         if not isinstance(rate, (int, float)):
             raise ValueError("Terminal growth rate must be a number.")
         self._terminal_growth_rate = rate
+        self._spread = self._wacc - rate
         return self
 
     def set_wacc(self, wacc: float):
         if not isinstance(wacc, (int, float)) or not (0 < wacc < 1):
             raise ValueError("WACC must be a number between 0 and 1 (exclusive).")
         self._wacc = wacc
+        self._spread = wacc - self._terminal_growth_rate
         return self
 
     def set_cash_and_equivalents(self, cash: float):
@@ -59,7 +243,7 @@ class DCF:
         return self._current_fcf
 
     def get_growth_rates(self):
-        return self._growth_rates
+        return [float(r) for r in self._growth_rates]
 
     def get_terminal_growth_rate(self):
         return self._terminal_growth_rate
@@ -81,50 +265,26 @@ class DCF:
         """
         Calculates the intrinsic value per share using the DCF model.
         """
-        if self._wacc <= self._terminal_growth_rate:
-            raise ValueError("WACC must be greater than the terminal growth rate for a stable terminal value calculation.")
-        if not self._growth_rates:
+        # len() rather than truthiness: an ndarray of growth rates has no unambiguous bool
+        if len(self._growth_rates) == 0:
             raise ValueError("Growth rates list cannot be empty. Please set growth rates for projection period.")
+        if self._spread <= 0:
+            raise ValueError("WACC must be greater than the terminal growth rate for a stable terminal value calculation.")
         if self._current_fcf <= 0:
             print("Warning: Current FCF is zero or negative. DCF might not be appropriate or projections need careful review.")
 
-        # 1. Project Free Cash Flows (FCF) for the explicit forecast period
-        projected_fcfs = []
-        last_fcf = self._current_fcf
-        for i, growth_rate in enumerate(self._growth_rates):
-            next_fcf = last_fcf * (1 + growth_rate)
-            projected_fcfs.append(next_fcf)
-            last_fcf = next_fcf
-
-        # 2. Discount Projected FCFs to Present Value
-        present_value_of_fcfs = 0
-        for i, fcf in enumerate(projected_fcfs):
-            discount_factor = (1 + self._wacc)**(i + 1)
-            present_value_of_fcfs += fcf / discount_factor
-
-        # 3. Calculate Terminal Value (TV)
-        # Using the Gordon Growth Model: TV = FCF_n * (1 + g) / (WACC - g)
-        # FCF_n is the FCF of the last projected year.
-        # FCF_n * (1 + g) is the FCF for the first year beyond the explicit forecast.
-        last_projected_fcf = projected_fcfs[-1]
-        terminal_value = (last_projected_fcf * (1 + self._terminal_growth_rate)) / \
-                         (self._wacc - self._terminal_growth_rate)
-
-        # 4. Discount Terminal Value to Present Value
-        # The discount period is the number of years in the explicit forecast period.
-        discount_factor_tv = (1 + self._wacc)**len(self._growth_rates)
-        present_value_of_terminal_value = terminal_value / discount_factor_tv
-
-        # 5. Calculate Enterprise Value (EV)
-        enterprise_value = present_value_of_fcfs + present_value_of_terminal_value
-
-        # 6. Calculate Equity Value
-        equity_value = enterprise_value + self._cash_and_equivalents - self._total_debt
-
-        # 7. Calculate Intrinsic Value Per Share
         if self._shares_outstanding <= 0:
             return 0 # Avoid division by zero
-        intrinsic_value_per_share = equity_value / self._shares_outstanding
+
+        kernel = _get_dcf_kernel()
+        if kernel is _dcf_core:
+            # No compiled kernel: the plain Python loop is fastest on Python floats, not NumPy scalars
+            growth = self._growth_rates
+            projected_fcfs, values = self._calc_python(growth if isinstance(growth, list) else growth.tolist())
+        else:
+            projected_fcfs, values = self._calc_numpy(kernel)
+        (present_value_of_fcfs, terminal_value, present_value_of_terminal_value,
+         enterprise_value, equity_value, intrinsic_value_per_share) = values
 
         return {
             "projected_fcfs": projected_fcfs,
@@ -136,6 +296,117 @@ class DCF:
             "intrinsic_value_per_share": intrinsic_value_per_share
         }
 
+    def _calc_python(self, growth_rates):
+        """
+        Runs the plain Python _dcf_core over a list of growth rates, without any
+        NumPy calls. Used whenever no compiled kernel is available, e.g. under PyPy.
+        """
+        projected = [0.0] * len(growth_rates)
+        values = _dcf_core(self._current_fcf, growth_rates, self._wacc, self._terminal_growth_rate, self._spread,
+                           self._cash_and_equivalents, self._total_debt, self._shares_outstanding, projected)
+        return projected, values
+
+    def _calc_numpy(self, kernel):
+        """
+        Runs a compiled kernel (Cython or Numba) on the float64 growth-rate buffer.
+        """
+        import numpy as np
+
+        growth = np.ascontiguousarray(self._growth_rates, dtype=np.float64)
+        projected = np.empty_like(growth)
+        values = kernel(
+            float(self._current_fcf), growth, float(self._wacc), float(self._terminal_growth_rate), float(self._spread),
+            float(self._cash_and_equivalents), float(self._total_debt), float(self._shares_outstanding), projected)
+        return projected.tolist(), values
+
+    @staticmethod
+    def calc_batch(current_fcf, growth_rates, wacc, terminal_growth_rate=0.02,
+                   cash_and_equivalents=0.0, total_debt=0.0, shares_outstanding=1.0):
+        """
+        Values many scenarios at once using NumPy broadcasting.
+
+        ``growth_rates`` has shape (N, T): one row of T growth rates per scenario.
+        Every other argument is either a scalar shared by all scenarios or an
+        array of shape (N,). Returns a structured array of length N with the
+        same fields as the dictionary returned by calc().
+        """
+        import numpy as np
+
+        growth = np.asarray(growth_rates, dtype=np.float64)
+        if growth.ndim != 2 or growth.shape[1] == 0:
+            raise ValueError("Growth rates must be a 2-D array with one non-empty row per scenario.")
+        n_scenarios, n_years = growth.shape
+
+        def column(values):
+            return np.broadcast_to(np.asarray(values, dtype=np.float64), (n_scenarios,))
+
+        fcf = column(current_fcf)
+        wacc = column(wacc)
+        g_term = column(terminal_growth_rate)
+        cash = column(cash_and_equivalents)
+        debt = column(total_debt)
+        shares = column(shares_outstanding)
+        if np.any(wacc <= g_term):
+            raise ValueError("WACC must be greater than the terminal growth rate for a stable terminal value calculation.")
+        if np.any(shares <= 0):
+            raise ValueError("Shares outstanding must be a positive number.")
+
+        # Build the (N, T) cashflow and discount matrices, then reduce along the years axis
+        projected = fcf[:, None] * np.cumprod(1.0 + growth, axis=1)
+        discount = (1.0 + wacc[:, None]) ** np.arange(1, n_years + 1)[None, :]
+        present_value_of_fcfs = (projected / discount).sum(axis=1)
+
+        terminal_value = projected[:, -1] * (1.0 + g_term) / (wacc - g_term)
+        present_value_of_terminal_value = terminal_value / discount[:, -1]
+
+        enterprise_value = present_value_of_fcfs + present_value_of_terminal_value
+        equity_value = enterprise_value + cash - debt
+
+        results = np.empty(n_scenarios, dtype=[
+            ("projected_fcfs", np.float64, (n_years,)),
+            ("present_value_of_fcfs", np.float64),
+            ("terminal_value", np.float64),
+            ("present_value_of_terminal_value", np.float64),
+            ("enterprise_value", np.float64),
+            ("equity_value", np.float64),
+            ("intrinsic_value_per_share", np.float64),
+        ])
+        results["projected_fcfs"] = projected
+        results["present_value_of_fcfs"] = present_value_of_fcfs
+        results["terminal_value"] = terminal_value
+        results["present_value_of_terminal_value"] = present_value_of_terminal_value
+        results["enterprise_value"] = enterprise_value
+        results["equity_value"] = equity_value
+        results["intrinsic_value_per_share"] = equity_value / shares
+        return results
+
+    @staticmethod
+    def calc_many(current_fcf, growth_rates, wacc, terminal_growth_rate=0.02,
+                  cash_and_equivalents=0.0, total_debt=0.0, shares_outstanding=1.0):
+        """
+        Intrinsic value per share for any broadcastable combination of inputs.
+
+        The last axis of ``growth_rates`` is the projection period; all other axes,
+        and every scalar argument, broadcast against each other NumPy-style.
+        Returns an array of intrinsic values per share with the broadcast shape.
+        """
+        import numpy as np
+
+        growth = np.asarray(growth_rates, dtype=np.float64)
+        if growth.ndim == 0 or growth.shape[-1] == 0:
+            raise ValueError("Growth rates cannot be empty. Please set growth rates for projection period.")
+        wacc = np.asarray(wacc, dtype=np.float64)
+        g_term = np.asarray(terminal_growth_rate, dtype=np.float64)
+        shares = np.asarray(shares_outstanding, dtype=np.float64)
+        if np.any(wacc <= g_term):
+            raise ValueError("WACC must be greater than the terminal growth rate for a stable terminal value calculation.")
+        if np.any(shares <= 0):
+            raise ValueError("Shares outstanding must be a positive number.")
+
+        return _get_dcf_ufunc()(growth, wacc, g_term, np.asarray(current_fcf, dtype=np.float64),
+                                np.asarray(cash_and_equivalents, dtype=np.float64),
+                                np.asarray(total_debt, dtype=np.float64), shares)
+
 # --- Example Usage ---
 if __name__ == "__main__":
     try:
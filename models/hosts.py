@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api
+from odoo import models, fields
 
 
 class Hosts(models.Model):
@@ -9,7 +9,7 @@ class Hosts(models.Model):
     _inherit = ['mail.thread', 'mail.activity.mixin']
 
     name = fields.Char(name="Name", required=True, )
-    ip = fields.Char(name="Ip", required=True, tracking=True)
+    ip = fields.Char(name="Ip", required=True, tracking=True, index=True)
     ports = fields.Char(name="Ports", required=True, default="22")
     username = fields.Char(name="Username")
     
@@ -32,9 +32,3 @@ class Hosts(models.Model):
     cpu = fields.Integer(name="Cpu")
     ram = fields.Integer(name="Ram")
     disk = fields.Integer(name="Disk")
-
-    @api.depends('value')
-    def _value_pc(self):
-        for record in self:
-            record.value2 = float(record.value) / 100
-
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Locks the vectorized dcf_m1 forecast to the original per-year loop: same
+enterprise value, same forecast table when verbose, and no table otherwise.
+dcf_m1 star-imports modeling.data, which is not part of this tree, so a stub
+module stands in for it.
+"""
+import contextlib
+import io
+import os
+import sys
+import types
+import unittest
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models'))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    sys.modules.setdefault('modeling', types.ModuleType('modeling'))
+    sys.modules.setdefault('modeling.data', types.ModuleType('modeling.data'))
+    import dcf_m1
+
+INCOME_STATEMENT = [{'date': '2020-09-26', 'EBIT': '66288000000',
+                     'Income Tax Expense': '9680000000', 'Earnings before Tax': '67091000000'}]
+CASHFLOW_STATEMENT = [{'Depreciation & Amortization': '11056000000', 'Capital Expenditure': '-7309000000'}]
+BALANCE_STATEMENT = [{'Total assets': '323888000000', 'Total non-current assets': '180175000000'},
+                     {'Total assets': '338516000000', 'Total non-current assets': '175697000000'}]
+EV_STATEMENT = {'+ Total Debt': 112436000000.0, '- Cash & Cash Equivalents': 38016000000.0,
+                'Number of Shares': '17528214000'}
+FORECAST = dict(discount_rate=0.1, forecast_period=5, earnings_growth_rate=0.05,
+                cap_ex_growth_rate=0.045, perpetual_growth_rate=0.02)
+
+
+def _reference_enterprise_value(income_statement, cashflow_statement, balance_statement, period, discount_rate,
+                                earnings_growth_rate, cap_ex_growth_rate, perpetual_growth_rate):
+    """The original per-year loop, kept verbatim apart from taking no self."""
+    ebit = float(income_statement[0]['EBIT'])
+    tax_rate = float(income_statement[0]['Income Tax Expense']) / \
+        float(income_statement[0]['Earnings before Tax'])
+    non_cash_charges = float(cashflow_statement[0]['Depreciation & Amortization'])
+    cwc = (float(balance_statement[0]['Total assets']) - float(balance_statement[0]['Total non-current assets'])) - \
+        (float(balance_statement[1]['Total assets']) - float(balance_statement[1]['Total non-current assets']))
+    cap_ex = float(cashflow_statement[0]['Capital Expenditure'])
+    discount = discount_rate
+
+    flows = []
+
+    print('Forecasting flows for {} years out, starting at {}.'.format(period, income_statement[0]['date']),
+          ('\n         DFCF   |    EBIT   |    D&A    |    CWC     |   CAP_EX   | '))
+    for yr in range(1, period + 1):
+
+        ebit = ebit * (1 + (yr * earnings_growth_rate))
+        non_cash_charges = non_cash_charges * (1 + (yr * earnings_growth_rate))
+        cwc = cwc * 0.7
+        cap_ex = cap_ex * (1 + (yr * cap_ex_growth_rate))
+
+        flow = ebit * (1 - tax_rate) + non_cash_charges + cwc + cap_ex
+        PV_flow = flow / ((1 + discount) ** yr)
+        flows.append(PV_flow)
+
+        print(str(int(income_statement[0]['date'][0:4]) + yr) + '  ',
+              '%.2E' % Decimal(PV_flow) + ' | ',
+              '%.2E' % Decimal(ebit) + ' | ',
+              '%.2E' % Decimal(non_cash_charges) + ' | ',
+              '%.2E' % Decimal(cwc) + ' | ',
+              '%.2E' % Decimal(cap_ex) + ' | ')
+
+    NPV_FCF = sum(flows)
+
+    final_cashflow = flows[-1] * (1 + perpetual_growth_rate)
+    TV = final_cashflow / (discount - perpetual_growth_rate)
+    NPV_TV = TV / (1 + discount) ** (1 + period)
+
+    return NPV_TV + NPV_FCF
+
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestForecastMatchesLoop(unittest.TestCase):
+
+    def _reference(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            enterprise_value = _reference_enterprise_value(INCOME_STATEMENT, CASHFLOW_STATEMENT, BALANCE_STATEMENT,
+                                                           FORECAST['forecast_period'], FORECAST['discount_rate'],
+                                                           FORECAST['earnings_growth_rate'],
+                                                           FORECAST['cap_ex_growth_rate'],
+                                                           FORECAST['perpetual_growth_rate'])
+        return enterprise_value, out.getvalue()
+
+    def _dcf(self, verbose):
+        return dcf_m1.DCF() \
+            .set_ticker('AAPL') \
+            .set_statements(EV_STATEMENT, INCOME_STATEMENT, BALANCE_STATEMENT, CASHFLOW_STATEMENT) \
+            .set_forecast_parameters(verbose=verbose, **FORECAST)
+
+    def test_enterprise_value_matches_loop(self):
+        expected, _ = self._reference()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = self._dcf(verbose=False).calculate_dcf()
+        self.assertAlmostEqual(result['enterprise_value'], expected, delta=abs(expected) * 1e-12)
+
+    def test_verbose_table_matches_loop(self):
+        _, expected_table = self._reference()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self._dcf(verbose=True)._calculate_enterprise_value()
+        self.assertEqual(out.getvalue(), expected_table)
+
+    def test_quiet_forecast_prints_nothing(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self._dcf(verbose=False)._calculate_enterprise_value()
+        self.assertEqual(out.getvalue(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Checks that the gdcf valuation paths agree: the pure Python kernel, the
+gufunc body, calc(), calc_batch(), calc_many() and, when built, the Cython
+extension. gdcf is a standalone module, so it is imported from models/
+directly rather than through the Odoo addon package.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models'))
+
+import gdcf
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import _dcf_core as cdcf
+except ImportError:
+    cdcf = None
+
+# (current_fcf, growth_rates, wacc, terminal_growth_rate, cash, debt, shares)
+SCENARIOS = [
+    (100.0, [0.15, 0.10, 0.08, 0.05, 0.03], 0.09, 0.02, 50.0, 20.0, 100.0),
+    (50.0, [0.20, 0.15, 0.12], 0.11, 0.025, 30.0, 10.0, 50.0),
+    (80.0, [0.07, -0.02, 0.04, 0.05, 0.06], 0.10, 0.02, 0.0, 25.0, 40.0),
+]
+
+
+def _python_core(fcf, growth, wacc, g_term, cash, debt, shares):
+    projected = [0.0] * len(growth)
+    return gdcf._dcf_core(fcf, growth, wacc, g_term, wacc - g_term, cash, debt, shares, projected)
+
+
+class TestKernelEquivalence(unittest.TestCase):
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_gufunc_body_matches_core(self):
+        dcf_gu = gdcf._make_dcf_gu(gdcf._dcf_core)
+        for fcf, growth, wacc, g_term, cash, debt, shares in SCENARIOS:
+            out = [0.0]
+            dcf_gu(np.array(growth), wacc, g_term, fcf, cash, debt, shares, out)
+            self.assertEqual(out[0], _python_core(fcf, growth, wacc, g_term, cash, debt, shares)[5])
+
+    def test_calc_python_path(self):
+        # PyPy: growth rates stored as a list and no compiled kernel available
+        with mock.patch.object(gdcf, '_PYPY', True), mock.patch.object(gdcf, '_dcf_kernel', gdcf._dcf_core):
+            dcf = gdcf.DCF.from_params(*SCENARIOS[0])
+            self.assertIsInstance(dcf._growth_rates, list)
+            result = dcf.calc()
+        self.assertAlmostEqual(result['intrinsic_value_per_share'], 19.444261768896, places=9)
+        self.assertEqual(result['intrinsic_value_per_share'], _python_core(*SCENARIOS[0])[5])
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_calc_without_compiled_kernel_returns_floats(self):
+        dcf = gdcf.DCF.from_params(*SCENARIOS[0])
+        self.assertIsInstance(dcf._growth_rates, np.ndarray)
+        with mock.patch.object(gdcf, '_dcf_kernel', gdcf._dcf_core):
+            result = dcf.calc()
+        self.assertEqual(result['intrinsic_value_per_share'], _python_core(*SCENARIOS[0])[5])
+        for name, value in result.items():
+            if name == 'projected_fcfs':
+                self.assertTrue(all(type(fcf) is float for fcf in value))
+            else:
+                self.assertIs(type(value), float, name)
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_from_params_rejects_non_flat_growth_rates(self):
+        for growth_rates in (0.05, [[0.1, 0.2]]):
+            with self.assertRaises(ValueError):
+                gdcf.DCF.from_params(100, growth_rates)
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_calc_batch_and_calc_many_match_calc(self):
+        growth_rates = np.array([s[1] for s in SCENARIOS[::2]])
+        columns = [np.array([s[i] for s in SCENARIOS[::2]]) for i in (0, 2, 3, 4, 5, 6)]
+        fcf, wacc, g_term, cash, debt, shares = columns
+        expected = [gdcf.DCF.from_params(*s).calc()['intrinsic_value_per_share'] for s in SCENARIOS[::2]]
+
+        batch = gdcf.DCF.calc_batch(fcf, growth_rates, wacc, g_term, cash, debt, shares)
+        many = gdcf.DCF.calc_many(fcf, growth_rates, wacc, g_term, cash, debt, shares)
+        np.testing.assert_allclose(batch['intrinsic_value_per_share'], expected, rtol=1e-12)
+        np.testing.assert_allclose(many, expected, rtol=1e-12)
+
+    @unittest.skipUnless(np, "NumPy is not installed")
+    def test_calc_many_without_numba(self):
+        growth_rates = np.array([s[1] for s in SCENARIOS[::2]])
+        expected = gdcf.DCF.calc_many(100.0, growth_rates, 0.09)
+        with mock.patch.object(gdcf, '_jit_dcf_core', lambda: None), mock.patch.object(gdcf, '_dcf_ufunc', None):
+            fallback = gdcf.DCF.calc_many(100.0, growth_rates, 0.09)
+        np.testing.assert_allclose(fallback, expected, rtol=1e-12)
+
+    @unittest.skipUnless(np is not None and cdcf is not None, "Cython extension is not built")
+    def test_cython_kernel_matches_core(self):
+        for fcf, growth, wacc, g_term, cash, debt, shares in SCENARIOS:
+            growth_arr = np.array(growth)
+            projected = np.empty_like(growth_arr)
+            values = cdcf.dcf_core(fcf, growth_arr, wacc, g_term, wacc - g_term, cash, debt, shares, projected)
+            expected = _python_core(fcf, growth, wacc, g_term, cash, debt, shares)
+            np.testing.assert_allclose(values, expected, rtol=1e-12)
+            self.assertEqual(cdcf.dcf_intrinsic(fcf, growth_arr, wacc, g_term, cash, debt, shares), values[5])
+
+
+
+    @unittest.skipUnless(np is not None and cdcf is not None, "Cython extension is not built")
+    def test_kernel_prefers_cython_extension(self):
+        with mock.patch.object(gdcf, '_dcf_kernel', None):
+            self.assertIs(gdcf._get_dcf_kernel(), cdcf.dcf_core)
+
+
+class TestSetterChain(unittest.TestCase):
+
+    def test_spread_follows_setters(self):
+        fcf, growth, wacc, g_term, cash, debt, shares = SCENARIOS[0]
+        dcf = gdcf.DCF() \
+            .set_current_fcf(fcf) \
+            .set_growth_rates(growth) \
+            .set_terminal_growth_rate(0.12) \
+            .set_wacc(0.5) \
+            .set_terminal_growth_rate(g_term) \
+            .set_wacc(wacc) \
+            .set_cash_and_equivalents(cash) \
+            .set_total_debt(debt) \
+            .set_shares_outstanding(shares)
+        self.assertEqual(dcf._spread, wacc - g_term)
+        self.assertEqual(dcf.calc()['intrinsic_value_per_share'],
+                         gdcf.DCF.from_params(*SCENARIOS[0]).calc()['intrinsic_value_per_share'])
+
+    def test_terminal_growth_above_wacc_raises(self):
+        dcf = gdcf.DCF().set_current_fcf(100).set_growth_rates([0.1, 0.05]).set_wacc(0.08)
+        dcf.set_terminal_growth_rate(0.09)
+        with self.assertRaisesRegex(ValueError, "WACC must be greater than the terminal growth rate"):
+            dcf.calc()
+
+    def test_empty_growth_rates_checked_first(self):
+        dcf = gdcf.DCF().set_terminal_growth_rate(0.5)
+        with self.assertRaisesRegex(ValueError, "Growth rates list cannot be empty"):
+            dcf.calc()
+
+    def test_get_growth_rates_returns_list(self):
+        dcf = gdcf.DCF().set_growth_rates([0.15, 0.10, 0.08])
+        if np is not None and not gdcf._PYPY:
+            self.assertIsInstance(dcf._growth_rates, np.ndarray)
+        rates = dcf.get_growth_rates()
+        self.assertEqual(rates, [0.15, 0.10, 0.08])
+        self.assertIsInstance(rates, list)
+        self.assertTrue(all(type(r) is float for r in rates))
+
+
+if __name__ == '__main__':
+    unittest.main()